@@ -3,9 +3,13 @@ Database Helper Functions
 
 MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
+
+Uses the async Motor driver so database I/O yields to the event loop
+instead of blocking a threadpool worker.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReadPreference
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
@@ -17,16 +21,29 @@ load_dotenv()
 
 _client = None
 db = None
+read_db = None
 
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # Single shared client; sized pool and wire compression instead of the
+    # driver defaults
+    _client = AsyncIOMotorClient(
+        database_url,
+        maxPoolSize=int(os.getenv("MONGO_POOL", "50")),
+        minPoolSize=5,
+        maxIdleTimeMS=60000,
+        serverSelectionTimeoutMS=3000,
+        compressors="zstd,zlib",
+    )
     db = _client[database_name]
+    # Read-only hot paths (product catalog) tolerate slight staleness, so
+    # route them to a secondary replica when one is available
+    read_db = _client.get_database(database_name, read_preference=ReadPreference.SECONDARY_PREFERRED)
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -40,16 +57,39 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def create_documents(collection_name: str, docs: list):
+    """Insert many documents with timestamps in a single round-trip"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    now = datetime.now(timezone.utc)
+    doc_dicts = []
+    for data in docs:
+        data_dict = data.model_dump() if isinstance(data, BaseModel) else data.copy()
+        data_dict['created_at'] = now
+        data_dict['updated_at'] = now
+        doc_dicts.append(data_dict)
+
+    result = await db[collection_name].insert_many(doc_dicts, ordered=False)
+    return [str(_id) for _id in result.inserted_ids]
+
+async def count_documents_fast(collection_name: str) -> int:
+    """Approximate document count from collection metadata (no scan)"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
-    cursor = db[collection_name].find(filter_dict or {})
+
+    return await db[collection_name].estimated_document_count()
+
+async def get_documents(collection_name: str, filter_dict: dict = None, projection: dict = None, limit: int = None):
+    """Get documents from collection, optionally projecting only needed fields"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    cursor = db[collection_name].find(filter_dict or {}, projection)
     if limit:
         cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    return [doc async for doc in cursor]
@@ -0,0 +1,19 @@
+"""
+Gunicorn Configuration
+
+Process-level parallelism for the FastAPI app: one async Uvicorn worker
+per process, sized to the host's core count. Launch with:
+
+    gunicorn main:app -c gunicorn_conf.py -b 0.0.0.0:$PORT
+"""
+
+import multiprocessing
+import os
+
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 30
+timeout = 60
+
+# Skip pydantic-core backtrace collection on validation errors in prod
+raw_env = ["PYDANTIC_CORE_NO_BACKTRACE=1"]
@@ -1,31 +1,91 @@
 import os
+import time
+from contextlib import asynccontextmanager
+
+from arq.connections import RedisSettings, create_pool
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, EmailStr
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+from redis import asyncio as aioredis
 from typing import List, Optional
 from bson import ObjectId
 
-from database import db, create_document, get_documents
+from database import db, read_db, count_documents_fast, create_document, create_documents
 from schemas import Product, Order, OrderItem
 
-app = FastAPI(title="Honey & Bees Store API")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+    redis = aioredis.from_url(redis_url)
+    FastAPICache.init(RedisBackend(redis), prefix="hb")
+    # Job queue for order follow-up work (see worker.py); keeps slow or
+    # CPU-heavy tasks off the request event loop
+    try:
+        app.state.queue = await create_pool(RedisSettings.from_dsn(redis_url))
+    except Exception:
+        app.state.queue = None
+    if db is not None:
+        # Idempotent; keeps future filtered lookups off collection scans
+        await db.product.create_index([("category", 1), ("in_stock", 1)])
+        await db.product.create_index("title")
+        await db.order.create_index("customer_email")
+    yield
+    if app.state.queue is not None:
+        await app.state.queue.close()
+    await redis.close()
+
+
+app = FastAPI(
+    title="Honey & Bees Store API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Explicit origins: "*" with credentials is invalid per spec, and a concrete
+# list plus a long max_age lets browsers cache preflight responses
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[os.getenv("FRONTEND_ORIGIN", "https://example.com")],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
 
+# Liveness body never changes; encode it once at import time
+_ROOT_BODY = orjson.dumps({"message": "Honey & Bees Store Backend is running"})
+
+
 @app.get("/")
-def read_root():
-    return {"message": "Honey & Bees Store Backend is running"}
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+# Env configuration is fixed for the process lifetime; check it once at import
+_DB_URL_SET = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
+_DB_NAME_SET = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+
+# Collection list for /test, refreshed at most once a minute so monitoring
+# probes don't issue an admin command per hit
+_COLL_CACHE = {"ts": 0.0, "val": []}
+
+
+async def _cached_collections():
+    now = time.time()
+    if now - _COLL_CACHE["ts"] > 60:
+        _COLL_CACHE["val"] = await db.list_collection_names()
+        _COLL_CACHE["ts"] = now
+    return _COLL_CACHE["val"]
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
     """Test endpoint to check if database is available and accessible"""
     response = {
         "backend": "✅ Running",
@@ -44,7 +104,7 @@ def test_database():
             response["connection_status"] = "Connected"
 
             try:
-                collections = db.list_collection_names()
+                collections = await _cached_collections()
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -55,107 +115,187 @@ def test_database():
     except Exception as e:
         response["database"] = f"❌ Error: {str(e)[:50]}"
 
-    import os
-    response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-    response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+    response["database_url"] = _DB_URL_SET
+    response["database_name"] = _DB_NAME_SET
 
     return response
 
 
 # -------- Products Endpoints --------
 
-@app.get("/api/products", response_model=List[Product])
-def list_products():
+# Only the fields the API serves; keeps BSON decode and network bytes down
+PRODUCT_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "price": 1,
+    "price_cents": 1,
+    "category": 1,
+    "in_stock": 1,
+    "image": 1,
+    "rating": 1,
+    "stock_qty": 1,
+}
+
+
+def _product_dict(d: dict) -> dict:
+    """Normalize a trusted Mongo product document into a response dict.
+
+    The data was already validated on write, so we skip Pydantic here and
+    just fill in defaults and stringify the ObjectId.
+    """
+    price_cents = d.get("price_cents")
+    return {
+        "_id": str(d["_id"]) if "_id" in d else None,
+        "title": d.get("title"),
+        "description": d.get("description"),
+        # Prices are stored as integer cents; legacy documents may still
+        # carry a float price
+        "price": price_cents / 100 if price_cents is not None else float(d.get("price", 0)),
+        "category": d.get("category", "honey"),
+        "in_stock": bool(d.get("in_stock", True)),
+        "image": d.get("image"),
+        "rating": float(d.get("rating", 4.8)),
+        "stock_qty": int(d.get("stock_qty", 10)),
+    }
+
+
+PRODUCTS_CACHE_KEY = "hb:products"
+PRODUCTS_CACHE_TTL = 60
+# Bodies larger than this are streamed without being cached, so buffering
+# for the cache tee cannot grow with catalog size
+PRODUCTS_CACHE_MAX_BYTES = 1024 * 1024
+
+
+async def _invalidate_products_cache():
+    """Drop the cached products listing after a catalog write.
+
+    Deletes the exact key: a namespace-level FastAPICache.clear(\"hb\")
+    would look for \"hb:hb:*\" because of the init prefix and miss it.
+    """
     try:
-        docs = get_documents("product")
-        # Convert ObjectId to string for any _id present
-        for d in docs:
-            if "_id" in d:
-                d["_id"] = str(d["_id"])
-        # Return as list of Product-like dicts (response_model will validate)
-        return [
-            Product(
-                title=d.get("title"),
-                description=d.get("description"),
-                price=float(d.get("price", 0)),
-                category=d.get("category", "honey"),
-                in_stock=bool(d.get("in_stock", True)),
-                image=d.get("image"),
-                rating=float(d.get("rating", 4.8)),
-                stock_qty=int(d.get("stock_qty", 10)),
-            ).model_dump()
-            for d in docs
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        await FastAPICache.get_backend().clear(key=PRODUCTS_CACHE_KEY)
+    except Exception:
+        pass
+
+
+@app.get("/api/products", response_model=None)
+async def list_products():
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    try:
+        cached = await FastAPICache.get_backend().get(PRODUCTS_CACHE_KEY)
+    except Exception:
+        cached = None
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Stream documents as they arrive; tee the chunks into Redis for the
+    # next request, but stop buffering past the cap so peak memory stays
+    # bounded for oversized catalogs (they are just re-streamed each time).
+    async def gen():
+        chunks = [b"["]
+        buffered = 1
+        yield b"["
+        first = True
+        async for d in read_db["product"].find({}, PRODUCT_PROJECTION).batch_size(500):
+            if not first:
+                yield b","
+            first = False
+            chunk = orjson.dumps(_product_dict(d))
+            yield chunk
+            if chunks is not None:
+                buffered += len(chunk) + 2
+                if buffered > PRODUCTS_CACHE_MAX_BYTES:
+                    chunks = None
+                else:
+                    if len(chunks) > 1:
+                        chunks.append(b",")
+                    chunks.append(chunk)
+        yield b"]"
+        if chunks is not None:
+            chunks.append(b"]")
+            try:
+                await FastAPICache.get_backend().set(PRODUCTS_CACHE_KEY, b"".join(chunks), PRODUCTS_CACHE_TTL)
+            except Exception:
+                pass
+
+    return StreamingResponse(gen(), media_type="application/json")
 
 
 class CreateProduct(Product):
     pass
 
 @app.post("/api/products", status_code=201)
-def create_product(product: CreateProduct):
+async def create_product(product: CreateProduct):
     try:
-        inserted_id = create_document("product", product)
-        return {"id": inserted_id, "message": "Product created"}
+        inserted_id = await create_document("product", product)
+        await _invalidate_products_cache()
+        # Compose the tiny body directly; skips the response encoder entirely
+        return Response(
+            content=b'{"id":"%b","message":"Product created"}' % inserted_id.encode(),
+            media_type="application/json",
+            status_code=201,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Built once at import so unseeded calls don't re-allocate four dicts
+DEFAULT_PRODUCTS = (
+    {
+        "title": "Wildflower Honey",
+        "description": "Raw, unfiltered wildflower honey with rich floral notes.",
+        "price_cents": 1299,
+        "category": "honey",
+        "in_stock": True,
+        "image": "https://images.unsplash.com/photo-1519681393784-d120267933ba",
+        "rating": 4.9,
+        "stock_qty": 120,
+    },
+    {
+        "title": "Beeswax Candles (Set of 3)",
+        "description": "Hand-poured 100% beeswax candles with natural honey aroma.",
+        "price_cents": 1850,
+        "category": "beeswax",
+        "in_stock": True,
+        "image": "https://images.unsplash.com/photo-1505575972945-381d50a4ac7b",
+        "rating": 4.7,
+        "stock_qty": 80,
+    },
+    {
+        "title": "Propolis Tincture",
+        "description": "High-potency propolis extract for immunity support.",
+        "price_cents": 2200,
+        "category": "propolis",
+        "in_stock": True,
+        "image": "https://images.unsplash.com/photo-1517686469429-dc1c37a393f5",
+        "rating": 4.6,
+        "stock_qty": 60,
+    },
+    {
+        "title": "Bee Pollen Granules",
+        "description": "Nutrient-rich bee pollen harvested sustainably.",
+        "price_cents": 1575,
+        "category": "pollen",
+        "in_stock": True,
+        "image": "https://images.unsplash.com/photo-1505577058444-a3dab90d4253",
+        "rating": 4.8,
+        "stock_qty": 95,
+    },
+)
+
+
 # Seed some default products if collection empty
 @app.post("/api/seed", status_code=201)
-def seed_products():
+async def seed_products():
     try:
-        existing = get_documents("product", limit=1)
-        if existing:
+        if await count_documents_fast("product") > 0:
             return {"message": "Products already exist"}
 
-        defaults = [
-            {
-                "title": "Wildflower Honey",
-                "description": "Raw, unfiltered wildflower honey with rich floral notes.",
-                "price": 12.99,
-                "category": "honey",
-                "in_stock": True,
-                "image": "https://images.unsplash.com/photo-1519681393784-d120267933ba", 
-                "rating": 4.9,
-                "stock_qty": 120,
-            },
-            {
-                "title": "Beeswax Candles (Set of 3)",
-                "description": "Hand-poured 100% beeswax candles with natural honey aroma.",
-                "price": 18.5,
-                "category": "beeswax",
-                "in_stock": True,
-                "image": "https://images.unsplash.com/photo-1505575972945-381d50a4ac7b",
-                "rating": 4.7,
-                "stock_qty": 80,
-            },
-            {
-                "title": "Propolis Tincture",
-                "description": "High-potency propolis extract for immunity support.",
-                "price": 22.0,
-                "category": "propolis",
-                "in_stock": True,
-                "image": "https://images.unsplash.com/photo-1517686469429-dc1c37a393f5",
-                "rating": 4.6,
-                "stock_qty": 60,
-            },
-            {
-                "title": "Bee Pollen Granules",
-                "description": "Nutrient-rich bee pollen harvested sustainably.",
-                "price": 15.75,
-                "category": "pollen",
-                "in_stock": True,
-                "image": "https://images.unsplash.com/photo-1505577058444-a3dab90d4253",
-                "rating": 4.8,
-                "stock_qty": 95,
-            },
-        ]
-
-        for p in defaults:
-            create_document("product", p)
+        await create_documents("product", list(DEFAULT_PRODUCTS))
 
+        await _invalidate_products_cache()
         return {"message": "Seeded default products"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,6 +304,8 @@ def seed_products():
 # -------- Orders Endpoints --------
 
 class CreateOrder(BaseModel):
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, str_strip_whitespace=False, frozen=True)
+
     customer_name: str
     customer_email: EmailStr
     shipping_address: str
@@ -171,14 +313,26 @@ class CreateOrder(BaseModel):
     notes: Optional[str] = None
 
 @app.post("/api/orders", status_code=201)
-def create_order(order: CreateOrder):
+async def create_order(order: CreateOrder):
     try:
-        # Compute total
-        total = sum(item.unit_price * item.quantity for item in order.items)
+        # Integer cents make the total exact and the accumulation int-only
+        items = order.items
+        total_cents = sum(item.unit_price_cents * item.quantity for item in items)
         order_doc = order.model_dump()
-        order_doc["total"] = round(total, 2)
-        inserted_id = create_document("order", order_doc)
-        return {"id": inserted_id, "message": "Order placed", "total": order_doc["total"]}
+        order_doc["total_cents"] = total_cents
+        inserted_id = await create_document("order", order_doc)
+        # The follow-up job is non-critical: never fail a stored order
+        # because the queue is unreachable
+        if app.state.queue is not None:
+            try:
+                await app.state.queue.enqueue_job("send_order_email", inserted_id)
+            except Exception:
+                pass
+        return Response(
+            content=b'{"id":"%b","message":"Order placed","total":%.2f}' % (inserted_id.encode(), total_cents / 100),
+            media_type="application/json",
+            status_code=201,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -186,4 +340,14 @@ def create_order(order: CreateOrder):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Pass the import string (not the app object) so workers can fork
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 2)),
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
@@ -11,7 +11,7 @@ Model name is converted to lowercase for the collection name:
 - BlogPost -> "blogs" collection
 """
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import Optional, List
 
 # Example schemas adapted for Honey Store
@@ -21,6 +21,8 @@ class User(BaseModel):
     Users collection schema
     Collection name: "user" (lowercase of class name)
     """
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, str_strip_whitespace=False, frozen=True)
+
     name: str = Field(..., description="Full name")
     email: EmailStr = Field(..., description="Email address")
     address: Optional[str] = Field(None, description="Address")
@@ -32,31 +34,52 @@ class Product(BaseModel):
     Products collection schema for Honey & Bee products
     Collection name: "product" (lowercase of class name)
     """
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, str_strip_whitespace=False, frozen=True)
+
     title: str = Field(..., description="Product title")
     description: Optional[str] = Field(None, description="Product description")
-    price: float = Field(..., ge=0, description="Price in dollars")
+    price_cents: int = Field(..., ge=0, description="Price in integer cents")
     category: str = Field(..., description="Product category e.g., honey, beeswax, propolis, pollen, gifts")
     in_stock: bool = Field(True, description="Whether product is in stock")
     image: Optional[str] = Field(None, description="Image URL")
     rating: Optional[float] = Field(4.8, ge=0, le=5, description="Average rating")
     stock_qty: Optional[int] = Field(50, ge=0, description="Units available")
 
+    @property
+    def price(self) -> float:
+        """Price in dollars, derived from the stored integer cents"""
+        return self.price_cents / 100
+
 class OrderItem(BaseModel):
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, str_strip_whitespace=False, frozen=True)
+
     product_id: str = Field(..., description="ID of the product")
     title: str = Field(..., description="Snapshot of product title at purchase time")
-    unit_price: float = Field(..., ge=0, description="Unit price at purchase time")
+    unit_price_cents: int = Field(..., ge=0, description="Unit price in integer cents at purchase time")
     quantity: int = Field(..., ge=1, description="Quantity ordered")
 
+    @property
+    def unit_price(self) -> float:
+        """Unit price in dollars, derived from the stored integer cents"""
+        return self.unit_price_cents / 100
+
 class Order(BaseModel):
     """
     Orders collection schema
     Collection name: "order"
     """
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, str_strip_whitespace=False, frozen=True)
+
     customer_name: str = Field(..., description="Customer full name")
     customer_email: EmailStr = Field(..., description="Customer email")
     shipping_address: str = Field(..., description="Shipping address")
     items: List[OrderItem] = Field(..., description="List of items in the order")
     notes: Optional[str] = Field(None, description="Optional notes from customer")
-    total: Optional[float] = Field(None, ge=0, description="Computed server-side total")
+    total_cents: Optional[int] = Field(None, ge=0, description="Computed server-side total in integer cents")
+
+    @property
+    def total(self) -> Optional[float]:
+        """Total in dollars, derived from the stored integer cents"""
+        return None if self.total_cents is None else self.total_cents / 100
 
 # Add more schemas as needed for your store
@@ -0,0 +1,28 @@
+"""
+Regression test: catalog writes must drop the cached products listing.
+
+FastAPICache.clear(namespace="hb") combined with the "hb" init prefix
+looks for "hb:hb:*" keys and silently misses "hb:products", leaving the
+stale body served for the full TTL. The write paths therefore delete the
+exact key; this test pins that behavior.
+"""
+
+import asyncio
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+import main
+
+
+def test_products_cache_invalidated_on_write():
+    FastAPICache.init(InMemoryBackend(), prefix="hb")
+
+    async def scenario():
+        backend = FastAPICache.get_backend()
+        await backend.set(main.PRODUCTS_CACHE_KEY, b"[]", main.PRODUCTS_CACHE_TTL)
+        assert await backend.get(main.PRODUCTS_CACHE_KEY) == b"[]"
+        await main._invalidate_products_cache()
+        return await backend.get(main.PRODUCTS_CACHE_KEY)
+
+    assert asyncio.run(scenario()) is None
@@ -0,0 +1,24 @@
+"""
+Background Worker
+
+arq worker for order follow-up jobs (emails, invoices, fulfillment
+webhooks). Runs as a separate process so CPU-heavy or slow work never
+competes with the request event loop:
+
+    arq worker.WorkerSettings
+"""
+
+import os
+
+from arq.connections import RedisSettings
+
+
+async def send_order_email(ctx, order_id: str):
+    """Send the order confirmation email for a placed order"""
+    # Hook up the real mail provider here; for now just record the hand-off
+    print(f"Sending confirmation email for order {order_id}")
+
+
+class WorkerSettings:
+    functions = [send_order_email]
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))